@@ -1,29 +1,141 @@
 import os
-from flask import Flask, request, abort, jsonify
+import orjson
+from functools import wraps
+from hashlib import md5
+from flask import Flask, request, abort
 from flask_sqlalchemy import SQLAlchemy
-from flask_cors import CORS
-from models import setup_db, Movie, Actor
+from sqlalchemy import select, delete, func, text
+from sqlalchemy.exc import IntegrityError, DataError, OperationalError
+from models import setup_db, db, Movie, Actor
 from auth.auth import AuthError, requires_auth
-from datetime import datetime
+from datetime import date
+
+# Bound once at import so the response helper skips the module
+# attribute lookup on every call; no orjson options are needed since
+# date objects serialize natively
+_DUMPS = orjson.dumps
+
+# The CORS policy is static, so the headers are precomputed once and
+# written directly in after_request instead of going through
+# Flask-CORS per-request origin matching
+_CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Headers', 'Content-Type, Authorization, true'),
+    ('Access-Control-Allow-Methods', 'GET, POST, PATCH, DELETE, OPTIONS'),
+)
 
 
 def create_app(test_config=None):
     """Create and configure the app"""
     app = Flask(__name__)
+    if test_config:
+        # Applied before setup_db so tests can point the app at a
+        # different database and engine configuration
+        app.config.update(test_config)
     setup_db(app)
-    CORS(app)
+
+    response_class = app.response_class
+
+    def oj(payload, status=200):
+        """
+        oj(payload, status)
+            builds a JSON response with orjson instead of stdlib json
+            orjson serializes in native code, which is markedly faster
+            on list endpoints returning many formatted records
+        """
+        return response_class(
+            _DUMPS(payload),
+            status=status,
+            mimetype='application/json'
+        )
+
+    def oj_conditional(payload):
+        """
+        oj_conditional(payload)
+            builds a JSON response with an ETag derived from a hash
+            of the serialized body, so the validator depends only on
+            the data and stays consistent across gunicorn workers
+            and restarts
+            Returns a bodyless 304 when the client's If-None-Match
+                matches the current body
+        """
+        body = _DUMPS(payload)
+        etag = f'"{md5(body).hexdigest()}"'
+
+        if request.headers.get('If-None-Match') == etag:
+            return response_class(status=304)
+
+        response = response_class(
+            body,
+            status=200,
+            mimetype='application/json'
+        )
+        response.headers['ETag'] = etag
+        return response
+
+    def json_body(required=()):
+        """
+        json_body(required)
+            decorator that parses the request body once with orjson
+            and passes it to the handler as the 'body' kwarg
+            Raises a 400 if the body is missing, not a JSON object,
+                or any required key is absent or null
+        """
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                try:
+                    body = orjson.loads(request.get_data(cache=False))
+                except orjson.JSONDecodeError:
+                    abort(400)
+
+                if not isinstance(body, dict) or not body:
+                    abort(400)
+
+                for key in required:
+                    if body.get(key) is None:
+                        abort(400)
+
+                return f(*args, body=body, **kwargs)
+
+            return wrapper
+        return decorator
+
+    def pagination_args():
+        """
+        pagination_args()
+            reads ?page and ?per_page from the query string
+            per_page is capped at 100 to bound response size
+            Raises a 400 for non-positive values
+        """
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 30, type=int)
+
+        if page < 1 or per_page < 1:
+            abort(400)
+
+        return page, min(per_page, 100)
+
+    @app.cli.command('init-db')
+    def init_db():
+        """
+        flask init-db
+            creates all tables once at deploy time
+            keeps worker boot free of schema round trips
+        """
+        db.create_all()
+
+    @app.teardown_request
+    def rollback_on_error(error):
+        """Leave the pooled session clean after a failed request"""
+        if error is not None:
+            db.session.rollback()
 
     # CORS Headers
     @app.after_request
     def after_request(response):
-        response.headers.add(
-            'Access-Control-Allow-Headers',
-            'Content-Type, Authorization, true'
-        )
-        response.headers.add(
-            'Access-Control-Allow-Methods',
-            'GET, POST, PATCH, DELETE, OPTIONS'
-        )
+        for header, value in _CORS_HEADERS:
+            response.headers[header] = value
         return response
 
     # Routes
@@ -31,7 +143,7 @@ def create_app(test_config=None):
     @app.route('/')
     def index():
         """Health check endpoint"""
-        return jsonify({
+        return oj({
             'success': True,
             'message': 'Casting Agency API is running!'
         })
@@ -46,31 +158,50 @@ def create_app(test_config=None):
         """
         GET /actors
             Public endpoint that requires the 'get:actors' permission
-            Returns status code 200 and json {"success": True, "actors": actors}
-                where actors is the list of actors
+            Accepts ?page and ?per_page query parameters
+            Returns status code 200 and json
+                {"success": True, "actors": actors, "page": page,
+                 "total": total}
+                where actors is the requested page of actors
+            Supports conditional GET: repeat callers presenting a
+                matching If-None-Match header get a bodyless 304
         """
-        try:
-            actors = Actor.query.order_by(Actor.id).all()
-            
-            if not actors:
-                return jsonify({
-                    'success': True,
-                    'actors': []
-                })
-
-            formatted_actors = [actor.format() for actor in actors]
+        page, per_page = pagination_args()
 
-            return jsonify({
+        try:
+            # Column-only select skips ORM instance hydration on this
+            # read-only path
+            rows = db.session.execute(
+                select(Actor.id, Actor.name, Actor.age, Actor.gender)
+                .order_by(Actor.id)
+                .limit(per_page)
+                .offset((page - 1) * per_page)
+            ).all()
+
+            formatted_actors = [
+                {'id': r.id, 'name': r.name, 'age': r.age, 'gender': r.gender}
+                for r in rows
+            ]
+
+            total = db.session.execute(
+                select(func.count(Actor.id))
+            ).scalar()
+
+            return oj_conditional({
                 'success': True,
-                'actors': formatted_actors
+                'actors': formatted_actors,
+                'page': page,
+                'total': total
             })
 
-        except Exception:
+        except (IntegrityError, DataError):
+            db.session.rollback()
             abort(422)
 
     @app.route('/actors', methods=['POST'])
     @requires_auth('post:actors')
-    def create_actor(payload):
+    @json_body(required=('name', 'age', 'gender'))
+    def create_actor(payload, body):
         """
         POST /actors
             Endpoint that requires the 'post:actors' permission
@@ -78,33 +209,69 @@ def create_app(test_config=None):
             Returns status code 200 and json {"success": True, "actor": actor}
                 where actor is the newly created actor
         """
+        try:
+            actor = Actor(
+                name=body['name'],
+                age=body['age'],
+                gender=body['gender']
+            )
+            actor.insert()
+
+            return oj({
+                'success': True,
+                'actor': actor.format()
+            })
+
+        except (IntegrityError, DataError):
+            db.session.rollback()
+            abort(422)
+
+    @app.route('/actors/bulk', methods=['POST'])
+    @requires_auth('post:actors')
+    def create_actors_bulk(payload):
+        """
+        POST /actors/bulk
+            Endpoint that requires the 'post:actors' permission
+            Inserts many actors in one transaction via
+            bulk_insert_mappings, avoiding a round trip and commit
+            per row
+            Expects json {"actors": [{name, age, gender}, ...]}
+            Returns status code 200 and json
+                {"success": True, "created": count}
+        """
         body = request.get_json()
 
-        if not body:
+        # The type check comes first: a JSON array or scalar body has
+        # no .get and would otherwise raise instead of returning 400
+        if not isinstance(body, dict) or not isinstance(body.get('actors'), list):
             abort(400)
 
-        name = body.get('name', None)
-        age = body.get('age', None)
-        gender = body.get('gender', None)
+        actors = body['actors']
 
-        if not name or not age or not gender:
-            abort(400)
+        for entry in actors:
+            if not isinstance(entry, dict):
+                abort(400)
+            if not entry.get('name') or not entry.get('age') \
+                    or not entry.get('gender'):
+                abort(400)
 
         try:
-            actor = Actor(name=name, age=age, gender=gender)
-            actor.insert()
+            db.session.bulk_insert_mappings(Actor, actors)
+            db.session.commit()
 
-            return jsonify({
+            return oj({
                 'success': True,
-                'actor': actor.format()
+                'created': len(actors)
             })
 
-        except Exception:
+        except (IntegrityError, DataError):
+            db.session.rollback()
             abort(422)
 
     @app.route('/actors/<int:actor_id>', methods=['PATCH'])
     @requires_auth('patch:actors')
-    def update_actor(payload, actor_id):
+    @json_body()
+    def update_actor(payload, actor_id, body):
         """
         PATCH /actors/<actor_id>
             Endpoint that requires the 'patch:actors' permission
@@ -112,36 +279,27 @@ def create_app(test_config=None):
             Returns status code 200 and json {"success": True, "actor": actor}
                 where actor is the updated actor
         """
-        actor = Actor.query.filter(Actor.id == actor_id).one_or_none()
+        actor = db.session.get(Actor, actor_id)
 
         if actor is None:
             abort(404)
 
-        body = request.get_json()
-
-        if not body:
-            abort(400)
-
-        name = body.get('name', None)
-        age = body.get('age', None)
-        gender = body.get('gender', None)
-
         try:
-            if name:
-                actor.name = name
-            if age:
-                actor.age = age
-            if gender:
-                actor.gender = gender
+            # Key-presence check so falsy-but-valid values (age=0,
+            # empty string) still update the row
+            for field in ('name', 'age', 'gender'):
+                if field in body:
+                    setattr(actor, field, body[field])
 
             actor.update()
 
-            return jsonify({
+            return oj({
                 'success': True,
                 'actor': actor.format()
             })
 
-        except Exception:
+        except (IntegrityError, DataError):
+            db.session.rollback()
             abort(422)
 
     @app.route('/actors/<int:actor_id>', methods=['DELETE'])
@@ -154,21 +312,25 @@ def create_app(test_config=None):
             Returns status code 200 and json {"success": True, "delete": actor_id}
                 where actor_id is the id of the deleted actor
         """
-        actor = Actor.query.filter(Actor.id == actor_id).one_or_none()
-
-        if actor is None:
-            abort(404)
-
         try:
-            actor.delete()
+            # Single DELETE by primary key; no SELECT round trip or
+            # ORM hydration just to remove a row
+            result = db.session.execute(
+                delete(Actor).where(Actor.id == actor_id)
+            )
+            db.session.commit()
+
+        except (IntegrityError, DataError):
+            db.session.rollback()
+            abort(422)
 
-            return jsonify({
-                'success': True,
-                'delete': actor_id
-            })
+        if result.rowcount == 0:
+            abort(404)
 
-        except Exception:
-            abort(422)
+        return oj({
+            'success': True,
+            'delete': actor_id
+        })
 
     # ============================================================================
     # Movie Endpoints
@@ -180,31 +342,50 @@ def create_app(test_config=None):
         """
         GET /movies
             Public endpoint that requires the 'get:movies' permission
-            Returns status code 200 and json {"success": True, "movies": movies}
-                where movies is the list of movies
+            Accepts ?page and ?per_page query parameters
+            Returns status code 200 and json
+                {"success": True, "movies": movies, "page": page,
+                 "total": total}
+                where movies is the requested page of movies
+            Supports conditional GET: repeat callers presenting a
+                matching If-None-Match header get a bodyless 304
         """
-        try:
-            movies = Movie.query.order_by(Movie.id).all()
-            
-            if not movies:
-                return jsonify({
-                    'success': True,
-                    'movies': []
-                })
+        page, per_page = pagination_args()
 
-            formatted_movies = [movie.format() for movie in movies]
-
-            return jsonify({
+        try:
+            # Column-only select skips ORM instance hydration on this
+            # read-only path
+            rows = db.session.execute(
+                select(Movie.id, Movie.title, Movie.release_date)
+                .order_by(Movie.id)
+                .limit(per_page)
+                .offset((page - 1) * per_page)
+            ).all()
+
+            formatted_movies = [
+                {'id': r.id, 'title': r.title, 'release_date': r.release_date}
+                for r in rows
+            ]
+
+            total = db.session.execute(
+                select(func.count(Movie.id))
+            ).scalar()
+
+            return oj_conditional({
                 'success': True,
-                'movies': formatted_movies
+                'movies': formatted_movies,
+                'page': page,
+                'total': total
             })
 
-        except Exception:
+        except (IntegrityError, DataError):
+            db.session.rollback()
             abort(422)
 
     @app.route('/movies', methods=['POST'])
     @requires_auth('post:movies')
-    def create_movie(payload):
+    @json_body(required=('title', 'release_date'))
+    def create_movie(payload, body):
         """
         POST /movies
             Endpoint that requires the 'post:movies' permission
@@ -212,37 +393,80 @@ def create_app(test_config=None):
             Returns status code 200 and json {"success": True, "movie": movie}
                 where movie is the newly created movie
         """
+        try:
+            # Convert string date to date object
+            date_obj = date.fromisoformat(body['release_date'])
+
+            movie = Movie(title=body['title'], release_date=date_obj)
+            movie.insert()
+
+            return oj({
+                'success': True,
+                'movie': movie.format()
+            })
+
+        except (ValueError, TypeError):
+            # fromisoformat raises TypeError for non-string dates and
+            # ValueError for malformed ones; both are bad input
+            abort(400)
+        except (IntegrityError, DataError):
+            db.session.rollback()
+            abort(422)
+
+    @app.route('/movies/bulk', methods=['POST'])
+    @requires_auth('post:movies')
+    def create_movies_bulk(payload):
+        """
+        POST /movies/bulk
+            Endpoint that requires the 'post:movies' permission
+            Inserts many movies in one transaction via
+            bulk_insert_mappings, avoiding a round trip and commit
+            per row
+            Expects json {"movies": [{title, release_date}, ...]}
+            Returns status code 200 and json
+                {"success": True, "created": count}
+        """
         body = request.get_json()
 
-        if not body:
+        # The type check comes first: a JSON array or scalar body has
+        # no .get and would otherwise raise instead of returning 400
+        if not isinstance(body, dict) or not isinstance(body.get('movies'), list):
             abort(400)
 
-        title = body.get('title', None)
-        release_date = body.get('release_date', None)
+        movies = []
 
-        if not title or not release_date:
+        try:
+            for entry in body['movies']:
+                if not isinstance(entry, dict):
+                    abort(400)
+                if not entry.get('title') or not entry.get('release_date'):
+                    abort(400)
+                movies.append({
+                    'title': entry['title'],
+                    'release_date': date.fromisoformat(entry['release_date'])
+                })
+        except (ValueError, TypeError):
+            # fromisoformat raises TypeError for non-string dates and
+            # ValueError for malformed ones; both are bad input
             abort(400)
 
         try:
-            # Convert string date to date object
-            date_obj = datetime.strptime(release_date, '%Y-%m-%d').date()
-            
-            movie = Movie(title=title, release_date=date_obj)
-            movie.insert()
+            db.session.bulk_insert_mappings(Movie, movies)
+            db.session.commit()
 
-            return jsonify({
+            return oj({
                 'success': True,
-                'movie': movie.format()
+                'created': len(movies)
             })
 
-        except ValueError:
-            abort(400)
-        except Exception:
+        except (IntegrityError, DataError):
+            db.session.rollback()
             abort(422)
 
     @app.route('/movies/<int:movie_id>', methods=['PATCH'])
     @requires_auth('patch:movies')
-    def update_movie(payload, movie_id):
+    @json_body()
+    def update_movie(payload, movie_id, body):
         """
         PATCH /movies/<movie_id>
             Endpoint that requires the 'patch:movies' permission
@@ -250,36 +474,32 @@ def create_app(test_config=None):
             Returns status code 200 and json {"success": True, "movie": movie}
                 where movie is the updated movie
         """
-        movie = Movie.query.filter(Movie.id == movie_id).one_or_none()
+        movie = db.session.get(Movie, movie_id)
 
         if movie is None:
             abort(404)
 
-        body = request.get_json()
-
-        if not body:
-            abort(400)
-
-        title = body.get('title', None)
-        release_date = body.get('release_date', None)
-
         try:
-            if title:
-                movie.title = title
-            if release_date:
-                date_obj = datetime.strptime(release_date, '%Y-%m-%d').date()
-                movie.release_date = date_obj
+            # Key-presence check so falsy-but-valid values still
+            # update the row
+            if 'title' in body:
+                movie.title = body['title']
+            if 'release_date' in body:
+                movie.release_date = date.fromisoformat(body['release_date'])
 
             movie.update()
 
-            return jsonify({
+            return oj({
                 'success': True,
                 'movie': movie.format()
             })
 
-        except ValueError:
+        except (ValueError, TypeError):
+            # fromisoformat raises TypeError for non-string dates and
+            # ValueError for malformed ones; both are bad input
             abort(400)
-        except Exception:
+        except (IntegrityError, DataError):
+            db.session.rollback()
             abort(422)
 
     @app.route('/movies/<int:movie_id>', methods=['DELETE'])
@@ -292,21 +512,25 @@ def create_app(test_config=None):
             Returns status code 200 and json {"success": True, "delete": movie_id}
                 where movie_id is the id of the deleted movie
         """
-        movie = Movie.query.filter(Movie.id == movie_id).one_or_none()
-
-        if movie is None:
-            abort(404)
-
         try:
-            movie.delete()
+            # Single DELETE by primary key; no SELECT round trip or
+            # ORM hydration just to remove a row
+            result = db.session.execute(
+                delete(Movie).where(Movie.id == movie_id)
+            )
+            db.session.commit()
+
+        except (IntegrityError, DataError):
+            db.session.rollback()
+            abort(422)
 
-            return jsonify({
-                'success': True,
-                'delete': movie_id
-            })
+        if result.rowcount == 0:
+            abort(404)
 
-        except Exception:
-            abort(422)
+        return oj({
+            'success': True,
+            'delete': movie_id
+        })
 
     # ============================================================================
     # Error Handlers
@@ -315,47 +539,59 @@ def create_app(test_config=None):
     @app.errorhandler(400)
     def bad_request(error):
         """Handle 400 errors"""
-        return jsonify({
+        return oj({
             'success': False,
             'error': 400,
             'message': 'bad request'
-        }), 400
+        }, 400)
 
     @app.errorhandler(404)
     def not_found(error):
         """Handle 404 errors"""
-        return jsonify({
+        return oj({
             'success': False,
             'error': 404,
             'message': 'resource not found'
-        }), 404
+        }, 404)
 
     @app.errorhandler(422)
     def unprocessable(error):
         """Handle 422 errors"""
-        return jsonify({
+        return oj({
             'success': False,
             'error': 422,
             'message': 'unprocessable'
-        }), 422
+        }, 422)
 
     @app.errorhandler(500)
     def internal_server_error(error):
         """Handle 500 errors"""
-        return jsonify({
+        return oj({
             'success': False,
             'error': 500,
             'message': 'internal server error'
-        }), 500
+        }, 500)
 
     @app.errorhandler(AuthError)
     def auth_error(error):
         """Handle AuthError exceptions"""
-        return jsonify({
+        return oj({
             'success': False,
             'error': error.status_code,
             'message': error.error['description']
-        }), error.status_code
+        }, error.status_code)
+
+    # Warm-up: force orjson to resolve its native symbols and prime
+    # one pooled connection at boot so the first real request does
+    # not pay those costs
+    _DUMPS({'warmup': True})
+    with app.app_context():
+        try:
+            db.session.execute(text('SELECT 1'))
+            db.session.rollback()
+        except OperationalError:
+            # Best effort; the database may not be reachable yet
+            pass
 
     return app
 
@@ -363,4 +599,6 @@ def create_app(test_config=None):
 APP = create_app()
 
 if __name__ == '__main__':
-    APP.run(host='0.0.0.0', port=8080, debug=True)
+    # Dev convenience only; in production run under gunicorn:
+    #   gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:8080 app:APP
+    APP.run(host='0.0.0.0', port=8080)
@@ -1,8 +1,11 @@
 import json
 import os
+import time
+import threading
 from flask import request
 from functools import wraps
 import jwt
+from cachetools import TTLCache
 from urllib.request import urlopen
 
 
@@ -10,6 +13,34 @@ AUTH0_DOMAIN = os.environ.get('AUTH0_DOMAIN', 'your-domain.auth0.com')
 ALGORITHMS = ['RS256']
 API_AUDIENCE = os.environ.get('API_AUDIENCE', 'casting-agency')
 
+# Verified-payload cache: RS256 signature verification costs ~1ms of
+# CPU per request, so repeat requests with the same bearer token skip
+# it for up to 60 seconds (token expiry is still honored on hits)
+_payload_cache = TTLCache(maxsize=10000, ttl=60)
+_payload_cache_lock = threading.Lock()
+
+# The Auth0 signing keys rotate rarely; fetch them once per process
+# instead of a network round trip per verification
+_jwks = None
+_jwks_lock = threading.Lock()
+
+
+def _get_jwks():
+    """
+    _get_jwks()
+        Fetches the JWKS from Auth0 on first use and caches it for
+        the life of the process
+    """
+    global _jwks
+    if _jwks is None:
+        with _jwks_lock:
+            if _jwks is None:
+                jsonurl = urlopen(
+                    f'https://{AUTH0_DOMAIN}/.well-known/jwks.json'
+                )
+                _jwks = json.loads(jsonurl.read())
+    return _jwks
+
 
 # AuthError Exception
 class AuthError(Exception):
@@ -99,6 +130,36 @@ def verify_decode_jwt(token):
         @INPUTS
             token: a json web token (string)
 
+        Returns the decoded payload from the cache when the same
+            token was verified within the last 60 seconds, checking
+            the exp claim so a cached hit never outlives the token
+        Falls back to a full verification via _decode_and_verify
+    """
+    with _payload_cache_lock:
+        payload = _payload_cache.get(token)
+
+    if payload is not None:
+        if payload.get('exp', 0) <= time.time():
+            raise AuthError({
+                'code': 'token_expired',
+                'description': 'Token expired.'
+            }, 401)
+        return payload
+
+    payload = _decode_and_verify(token)
+
+    with _payload_cache_lock:
+        _payload_cache[token] = payload
+
+    return payload
+
+
+def _decode_and_verify(token):
+    """
+    _decode_and_verify(token)
+        @INPUTS
+            token: a json web token (string)
+
         It should be an Auth0 token with key id (kid)
         It verifies the token using Auth0 /.well-known/jwks.json
         It decodes the payload from the token
@@ -106,10 +167,9 @@ def verify_decode_jwt(token):
         Returns the decoded payload
     """
     from jwt.algorithms import RSAAlgorithm
-    
-    jsonurl = urlopen(f'https://{AUTH0_DOMAIN}/.well-known/jwks.json')
-    jwks = json.loads(jsonurl.read())
-    
+
+    jwks = _get_jwks()
+
     try:
         unverified_header = jwt.get_unverified_header(token)
     except jwt.DecodeError:
@@ -0,0 +1,200 @@
+import os
+
+import pytest
+
+# The suite TRUNCATEs both tables at session start and drops the
+# schema at session end, so it must never run against a development or
+# production database. DATABASE_URL is therefore forced to the test
+# database unconditionally (a `source setup.sh` export points at the
+# development database); set TEST_DATABASE_URL to use a different test
+# database. This runs before the app modules are imported, because
+# models.py reads DATABASE_URL at import time.
+os.environ['DATABASE_URL'] = os.environ.get(
+    'TEST_DATABASE_URL',
+    'postgresql://shenry@localhost:5432/casting_test'
+)
+
+# app / models / sqlalchemy are imported inside the fixtures rather
+# than here: importing app builds the database engine, so keeping the
+# module top to stdlib + pytest makes `pytest --collect-only` and
+# single-test runs (`pytest -k ...`) start without paying that cost.
+
+# Permissions granted to the short role tokens the suite uses by
+# default. Verification is stubbed for these so tests never hit Auth0
+# or pay RS256 signature checks; any other token (e.g. a real JWT
+# supplied through the environment) still goes through the real
+# verifier.
+ROLE_PERMISSIONS = {
+    'assistant': [
+        'get:actors', 'get:movies'
+    ],
+    'director': [
+        'get:actors', 'get:movies', 'post:actors', 'delete:actors',
+        'patch:actors', 'patch:movies'
+    ],
+    'producer': [
+        'get:actors', 'get:movies', 'post:actors', 'delete:actors',
+        'patch:actors', 'patch:movies', 'post:movies', 'delete:movies'
+    ]
+}
+
+
+def pytest_configure(config):
+    """
+    Refuse parallel runs on the PostgreSQL path.
+
+    Every xdist worker would share the same test database and race
+    each other's session-start TRUNCATE and session-end drop_all;
+    only the SQLite path gives each worker its own database.
+    """
+    if os.environ.get('USE_SQLITE_TESTS') == '1':
+        return
+    if getattr(config.option, 'numprocesses', None):
+        raise pytest.UsageError(
+            'pytest -n shares a single PostgreSQL test database '
+            'across workers; run parallel suites with '
+            'USE_SQLITE_TESTS=1.'
+        )
+
+
+def _sqlite_test_config():
+    """
+    SQLite in-memory keeps unit-test DML entirely in process; the
+    StaticPool shares the single in-memory database across all
+    connections. Set USE_SQLITE_TESTS=1 to opt in; the default stays
+    on PostgreSQL for dialect-faithful runs.
+    """
+    from sqlalchemy.pool import StaticPool
+
+    return {
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+        'SQLALCHEMY_ENGINE_OPTIONS': {
+            'poolclass': StaticPool,
+            'connect_args': {'check_same_thread': False}
+        }
+    }
+
+
+def _assert_disposable_database(db):
+    """
+    Bail out before any destructive setup unless the database is
+    clearly a test database (name ending in _test). A misconfigured
+    TEST_DATABASE_URL would otherwise be truncated and dropped.
+    """
+    url = db.engine.url
+    if url.drivername.startswith('postgresql') \
+            and not (url.database or '').endswith('_test'):
+        pytest.exit(
+            f"Refusing to run destructive test setup against database "
+            f"'{url.database}'; point TEST_DATABASE_URL at a database "
+            f"whose name ends in _test.",
+            returncode=1
+        )
+
+
+def _wipe_tables(app):
+    """
+    Empty both tables once at session start.
+
+    On PostgreSQL a single TRUNCATE ... RESTART IDENTITY CASCADE is
+    O(1) regardless of row count and resets the id sequences; other
+    dialects (SQLite) fall back to plain DELETEs. Rollback isolation
+    keeps the database clean for the rest of the session.
+    """
+    from sqlalchemy import text
+
+    from models import db, Actor, Movie
+
+    if db.engine.dialect.name == 'postgresql':
+        db.session.execute(text(
+            'TRUNCATE TABLE actors, movies RESTART IDENTITY CASCADE'
+        ))
+    else:
+        db.session.query(Actor).delete()
+        db.session.query(Movie).delete()
+    db.session.commit()
+
+
+@pytest.fixture(scope='session')
+def app():
+    """
+    The Flask application, created once for the whole test session.
+
+    An application context is pushed here and stays active for the
+    entire session, so fixtures and seed helpers use db.session
+    directly; tests must not push app.app_context() themselves.
+    """
+    from app import create_app
+    from models import db
+
+    if os.environ.get('USE_SQLITE_TESTS') == '1':
+        app = create_app(_sqlite_test_config())
+    else:
+        app = create_app()
+
+    ctx = app.app_context()
+    ctx.push()
+
+    _assert_disposable_database(db)
+
+    # The schema is built exactly once per session; create_app itself
+    # never runs create_all (deploys use the init-db CLI command)
+    db.create_all()
+    _wipe_tables(app)
+
+    yield app
+
+    db.drop_all()
+    ctx.pop()
+
+
+@pytest.fixture(autouse=True)
+def stub_auth(monkeypatch):
+    """Resolve role tokens locally instead of verifying against Auth0"""
+    import auth.auth
+
+    real_verify = auth.auth.verify_decode_jwt
+
+    def fake_verify(token):
+        if token in ROLE_PERMISSIONS:
+            return {'permissions': list(ROLE_PERMISSIONS[token])}
+        return real_verify(token)
+
+    monkeypatch.setattr(auth.auth, 'verify_decode_jwt', fake_verify)
+
+
+@pytest.fixture(scope='session')
+def client(app):
+    """A single Werkzeug test client reused across the session"""
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def db_session(app):
+    """
+    Run each test inside an outer transaction that is rolled back.
+
+    The session is bound to a single connection and joins its
+    transaction via SAVEPOINTs, so commits issued by the app release
+    a savepoint rather than hitting the WAL; the final rollback
+    restores a clean database with no per-test DELETE round trips.
+    """
+    from sqlalchemy.orm import scoped_session, sessionmaker
+
+    from models import db
+
+    connection = db.engine.connect()
+    trans = connection.begin()
+
+    original_session = db.session
+    db.session = scoped_session(sessionmaker(
+        bind=connection,
+        join_transaction_mode='create_savepoint'
+    ))
+
+    yield db.session
+
+    db.session.close()
+    trans.rollback()
+    connection.close()
+    db.session = original_session
@@ -1,5 +1,5 @@
 import os
-from sqlalchemy import Column, String, Integer, Date, create_engine
+from sqlalchemy import Column, String, Integer, Date, Index, create_engine
 from flask_sqlalchemy import SQLAlchemy
 import json
 from datetime import date
@@ -18,20 +18,30 @@ elif database_path.startswith("https://") or database_path.startswith("http://")
         "You can find this in your Render PostgreSQL service under 'Info' -> 'Connections' -> 'Internal Database URL'"
     )
 
-db = SQLAlchemy()
-
+# expire_on_commit=False keeps attributes loaded after commit, so the
+# format() call that follows insert() in the create handlers reads
+# self.id from memory instead of re-SELECTing the row
+db = SQLAlchemy(session_options={'expire_on_commit': False})
 
 def setup_db(app, database_path=database_path):
     """
     setup_db(app)
         binds a flask application and a SQLAlchemy service
     """
-    app.config["SQLALCHEMY_DATABASE_URI"] = database_path
+    app.config.setdefault("SQLALCHEMY_DATABASE_URI", database_path)
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # Size the connection pool for concurrent workers and recycle
+    # connections before the hosted Postgres idle timeout kills them;
+    # pre_ping transparently replaces stale sockets instead of erroring
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800
+    })
     db.app = app
     db.init_app(app)
-    with app.app_context():
-        db.create_all()
 
 
 class Movie(db.Model):
@@ -41,6 +51,12 @@ class Movie(db.Model):
     """
     __tablename__ = 'movies'
 
+    # Covering index so the paginated list query is an index-only
+    # scan already ordered by id, with no heap fetch or sort node
+    __table_args__ = (
+        Index('ix_movies_list', 'id', 'title', 'release_date'),
+    )
+
     id = Column(Integer, primary_key=True)
     title = Column(String(180), nullable=False)
     release_date = Column(Date, nullable=False)
@@ -90,15 +106,17 @@ class Movie(db.Model):
         """
         format()
             returns a dictionary representation of the movie
+            release_date stays a date object; orjson emits it as an
+            ISO-8601 string without a per-row strftime call
         """
         return {
             'id': self.id,
             'title': self.title,
-            'release_date': self.release_date.strftime('%Y-%m-%d')
+            'release_date': self.release_date
         }
 
     def __repr__(self):
-        return json.dumps(self.format())
+        return json.dumps(self.format(), default=str)
 
 
 class Actor(db.Model):
@@ -108,6 +126,12 @@ class Actor(db.Model):
     """
     __tablename__ = 'actors'
 
+    # Covering index so the paginated list query is an index-only
+    # scan already ordered by id, with no heap fetch or sort node
+    __table_args__ = (
+        Index('ix_actors_list', 'id', 'name', 'age', 'gender'),
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String(180), nullable=False)
     age = Column(Integer, nullable=False)
@@ -1,508 +1,352 @@
 import os
-import unittest
-import json
-from app import create_app
-from models import db, Actor, Movie
 from datetime import date
 
+import pytest
 
-class CastingAgencyTestCase(unittest.TestCase):
-    """This class represents the casting agency test case"""
-
-    def setUp(self):
-        """Define test variables and initialize app."""
-        # Set test database URL before creating app
-        self.database_name = "casting_test"
-        self.database_path = "postgresql://shenry@localhost:5432/{}".format(
-            self.database_name
-        )
-        os.environ['DATABASE_URL'] = self.database_path
-        
-        # Create app with test config
-        self.app = create_app()
-        self.client = self.app.test_client
-        
-        # JWT tokens for testing
-        # Replace these with actual JWT tokens from Auth0
-        self.casting_assistant_token = os.environ.get('CASTING_ASSISTANT_TOKEN', '')
-        self.casting_director_token = os.environ.get('CASTING_DIRECTOR_TOKEN', '')
-        self.executive_producer_token = os.environ.get('EXECUTIVE_PRODUCER_TOKEN', '')
-
-        # Sample actor data
-        self.new_actor = {
-            'name': 'Tom Hanks',
-            'age': 65,
-            'gender': 'Male'
-        }
-
-        # Sample movie data
-        self.new_movie = {
-            'title': 'Forrest Gump',
-            'release_date': '1994-07-06'
-        }
-
-    def tearDown(self):
-        """Executed after each test"""
-        with self.app.app_context():
-            # Clean up database
-            db.session.query(Actor).delete()
-            db.session.query(Movie).delete()
-            db.session.commit()
-
-    # ============================================================================
-    # Helper Methods
-    # ============================================================================
-
-    def get_headers(self, token):
-        """Helper method to create authorization headers"""
-        return {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
-
-    # ============================================================================
-    # Actor Endpoint Tests - Success Behavior
-    # ============================================================================
-
-    def test_get_actors_success(self):
-        """Test GET /actors with valid token"""
-        # Create a test actor first
-        with self.app.app_context():
-            actor = Actor(**self.new_actor)
-            actor.insert()
-
-        res = self.client().get(
-            '/actors',
-            headers=self.get_headers(self.casting_assistant_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-        self.assertTrue(data['actors'])
-        self.assertTrue(len(data['actors']) > 0)
-
-    def test_create_actor_success(self):
-        """Test POST /actors with valid token"""
-        res = self.client().post(
-            '/actors',
-            json=self.new_actor,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-        self.assertTrue(data['actor'])
-        self.assertEqual(data['actor']['name'], self.new_actor['name'])
-
-    def test_update_actor_success(self):
-        """Test PATCH /actors/<id> with valid token"""
-        # Create a test actor first
-        with self.app.app_context():
-            actor = Actor(**self.new_actor)
-            actor.insert()
-            actor_id = actor.id
-
-        updated_data = {'name': 'Tom Hanks Updated', 'age': 66}
-        
-        res = self.client().patch(
-            f'/actors/{actor_id}',
-            json=updated_data,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-        self.assertEqual(data['actor']['name'], updated_data['name'])
-
-    def test_delete_actor_success(self):
-        """Test DELETE /actors/<id> with valid token"""
-        # Create a test actor first
-        with self.app.app_context():
-            actor = Actor(**self.new_actor)
-            actor.insert()
-            actor_id = actor.id
-
-        res = self.client().delete(
-            f'/actors/{actor_id}',
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-        self.assertEqual(data['delete'], actor_id)
-
-    # ============================================================================
-    # Movie Endpoint Tests - Success Behavior
-    # ============================================================================
-
-    def test_get_movies_success(self):
-        """Test GET /movies with valid token"""
-        # Create a test movie first
-        with self.app.app_context():
-            movie = Movie(
-                title=self.new_movie['title'],
-                release_date=date.fromisoformat(self.new_movie['release_date'])
-            )
-            movie.insert()
-
-        res = self.client().get(
-            '/movies',
-            headers=self.get_headers(self.casting_assistant_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-        self.assertTrue(data['movies'])
-        self.assertTrue(len(data['movies']) > 0)
-
-    def test_create_movie_success(self):
-        """Test POST /movies with valid token"""
-        res = self.client().post(
-            '/movies',
-            json=self.new_movie,
-            headers=self.get_headers(self.executive_producer_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-        self.assertTrue(data['movie'])
-        self.assertEqual(data['movie']['title'], self.new_movie['title'])
-
-    def test_update_movie_success(self):
-        """Test PATCH /movies/<id> with valid token"""
-        # Create a test movie first
-        with self.app.app_context():
-            movie = Movie(
-                title=self.new_movie['title'],
-                release_date=date.fromisoformat(self.new_movie['release_date'])
-            )
-            movie.insert()
-            movie_id = movie.id
-
-        updated_data = {'title': 'Forrest Gump Updated'}
-        
-        res = self.client().patch(
-            f'/movies/{movie_id}',
-            json=updated_data,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-        self.assertEqual(data['movie']['title'], updated_data['title'])
-
-    def test_delete_movie_success(self):
-        """Test DELETE /movies/<id> with valid token"""
-        # Create a test movie first
-        with self.app.app_context():
-            movie = Movie(
-                title=self.new_movie['title'],
-                release_date=date.fromisoformat(self.new_movie['release_date'])
-            )
-            movie.insert()
-            movie_id = movie.id
-
-        res = self.client().delete(
-            f'/movies/{movie_id}',
-            headers=self.get_headers(self.executive_producer_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-        self.assertEqual(data['delete'], movie_id)
-
-    # ============================================================================
-    # Error Behavior Tests
-    # ============================================================================
-
-    def test_get_actors_no_auth_header(self):
-        """Test GET /actors without authorization header"""
-        res = self.client().get('/actors')
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 401)
-        self.assertEqual(data['success'], False)
-
-    def test_create_actor_missing_data(self):
-        """Test POST /actors with missing required fields"""
-        incomplete_actor = {'name': 'John Doe'}
-        
-        res = self.client().post(
-            '/actors',
-            json=incomplete_actor,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 400)
-        self.assertEqual(data['success'], False)
-
-    def test_update_actor_not_found(self):
-        """Test PATCH /actors/<id> with non-existent actor"""
-        updated_data = {'name': 'Non Existent Actor'}
-        
-        res = self.client().patch(
-            '/actors/999999',
-            json=updated_data,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 404)
-        self.assertEqual(data['success'], False)
-
-    def test_delete_actor_not_found(self):
-        """Test DELETE /actors/<id> with non-existent actor"""
-        res = self.client().delete(
-            '/actors/999999',
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 404)
-        self.assertEqual(data['success'], False)
-
-    def test_get_movies_no_auth_header(self):
-        """Test GET /movies without authorization header"""
-        res = self.client().get('/movies')
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 401)
-        self.assertEqual(data['success'], False)
-
-    def test_create_movie_missing_data(self):
-        """Test POST /movies with missing required fields"""
-        incomplete_movie = {'title': 'Incomplete Movie'}
-        
-        res = self.client().post(
-            '/movies',
-            json=incomplete_movie,
-            headers=self.get_headers(self.executive_producer_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 400)
-        self.assertEqual(data['success'], False)
-
-    def test_update_movie_not_found(self):
-        """Test PATCH /movies/<id> with non-existent movie"""
-        updated_data = {'title': 'Non Existent Movie'}
-        
-        res = self.client().patch(
-            '/movies/999999',
-            json=updated_data,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 404)
-        self.assertEqual(data['success'], False)
-
-    def test_delete_movie_not_found(self):
-        """Test DELETE /movies/<id> with non-existent movie"""
-        res = self.client().delete(
-            '/movies/999999',
-            headers=self.get_headers(self.executive_producer_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 404)
-        self.assertEqual(data['success'], False)
-
-    # ============================================================================
-    # RBAC Tests - Casting Assistant
-    # ============================================================================
-
-    def test_casting_assistant_get_actors(self):
-        """Test Casting Assistant can view actors"""
-        with self.app.app_context():
-            actor = Actor(**self.new_actor)
-            actor.insert()
-
-        res = self.client().get(
-            '/actors',
-            headers=self.get_headers(self.casting_assistant_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-
-    def test_casting_assistant_get_movies(self):
-        """Test Casting Assistant can view movies"""
-        with self.app.app_context():
-            movie = Movie(
-                title=self.new_movie['title'],
-                release_date=date.fromisoformat(self.new_movie['release_date'])
-            )
-            movie.insert()
-
-        res = self.client().get(
-            '/movies',
-            headers=self.get_headers(self.casting_assistant_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-
-    def test_casting_assistant_cannot_create_actor(self):
-        """Test Casting Assistant cannot create actors"""
-        res = self.client().post(
-            '/actors',
-            json=self.new_actor,
-            headers=self.get_headers(self.casting_assistant_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 403)
-        self.assertEqual(data['success'], False)
-
-    def test_casting_assistant_cannot_delete_actor(self):
-        """Test Casting Assistant cannot delete actors"""
-        with self.app.app_context():
-            actor = Actor(**self.new_actor)
-            actor.insert()
-            actor_id = actor.id
-
-        res = self.client().delete(
-            f'/actors/{actor_id}',
-            headers=self.get_headers(self.casting_assistant_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 403)
-        self.assertEqual(data['success'], False)
-
-    # ============================================================================
-    # RBAC Tests - Casting Director
-    # ============================================================================
-
-    def test_casting_director_create_actor(self):
-        """Test Casting Director can create actors"""
-        res = self.client().post(
-            '/actors',
-            json=self.new_actor,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-
-    def test_casting_director_delete_actor(self):
-        """Test Casting Director can delete actors"""
-        with self.app.app_context():
-            actor = Actor(**self.new_actor)
-            actor.insert()
-            actor_id = actor.id
-
-        res = self.client().delete(
-            f'/actors/{actor_id}',
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-
-    def test_casting_director_update_movie(self):
-        """Test Casting Director can update movies"""
-        with self.app.app_context():
-            movie = Movie(
-                title=self.new_movie['title'],
-                release_date=date.fromisoformat(self.new_movie['release_date'])
-            )
-            movie.insert()
-            movie_id = movie.id
-
-        updated_data = {'title': 'Updated Movie Title'}
-        
-        res = self.client().patch(
-            f'/movies/{movie_id}',
-            json=updated_data,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-
-    def test_casting_director_cannot_create_movie(self):
-        """Test Casting Director cannot create movies"""
-        res = self.client().post(
-            '/movies',
-            json=self.new_movie,
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 403)
-        self.assertEqual(data['success'], False)
-
-    def test_casting_director_cannot_delete_movie(self):
-        """Test Casting Director cannot delete movies"""
-        with self.app.app_context():
-            movie = Movie(
-                title=self.new_movie['title'],
-                release_date=date.fromisoformat(self.new_movie['release_date'])
-            )
-            movie.insert()
-            movie_id = movie.id
-
-        res = self.client().delete(
-            f'/movies/{movie_id}',
-            headers=self.get_headers(self.casting_director_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 403)
-        self.assertEqual(data['success'], False)
-
-    # ============================================================================
-    # RBAC Tests - Executive Producer
-    # ============================================================================
-
-    def test_executive_producer_create_movie(self):
-        """Test Executive Producer can create movies"""
-        res = self.client().post(
-            '/movies',
-            json=self.new_movie,
-            headers=self.get_headers(self.executive_producer_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-
-    def test_executive_producer_delete_movie(self):
-        """Test Executive Producer can delete movies"""
-        with self.app.app_context():
-            movie = Movie(
-                title=self.new_movie['title'],
-                release_date=date.fromisoformat(self.new_movie['release_date'])
-            )
-            movie.insert()
-            movie_id = movie.id
-
-        res = self.client().delete(
-            f'/movies/{movie_id}',
-            headers=self.get_headers(self.executive_producer_token)
-        )
-        data = json.loads(res.data)
-
-        self.assertEqual(res.status_code, 200)
-        self.assertEqual(data['success'], True)
-
-
-# Make the tests conveniently executable
-if __name__ == "__main__":
-    unittest.main()
+# models / sqlalchemy are imported inside the seed helpers so that
+# collecting this file stays stdlib-cheap (see conftest.py)
+
+
+# Role tokens: the short defaults are resolved locally by the
+# stub_auth fixture in conftest.py, so no Auth0 round trip or real
+# JWT is needed; export real tokens to exercise full verification
+ASSISTANT_TOKEN = os.environ.get('CASTING_ASSISTANT_TOKEN', 'assistant')
+DIRECTOR_TOKEN = os.environ.get('CASTING_DIRECTOR_TOKEN', 'director')
+PRODUCER_TOKEN = os.environ.get('EXECUTIVE_PRODUCER_TOKEN', 'producer')
+
+# Sample actor data
+NEW_ACTOR = {
+    'name': 'Tom Hanks',
+    'age': 65,
+    'gender': 'Male'
+}
+
+# Sample movie data; the date is parsed once at import rather than
+# per seeded test (the JSON payload keeps the ISO string form)
+NEW_MOVIE = {
+    'title': 'Forrest Gump',
+    'release_date': '1994-07-06'
+}
+NEW_MOVIE_DATE = date(1994, 7, 6)
+
+
+def _headers(token):
+    return {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/json'
+    }
+
+
+# Authorization headers are static per role, so they are built once at
+# import instead of a dict per request
+ASSISTANT_HEADERS = _headers(ASSISTANT_TOKEN)
+DIRECTOR_HEADERS = _headers(DIRECTOR_TOKEN)
+PRODUCER_HEADERS = _headers(PRODUCER_TOKEN)
+
+# Endpoint paths used throughout the suite
+ACTORS = '/actors'
+MOVIES = '/movies'
+
+
+def actor_url(actor_id):
+    return f'{ACTORS}/{actor_id}'
+
+
+def movie_url(movie_id):
+    return f'{MOVIES}/{movie_id}'
+
+
+def seed_actor(overrides=None):
+    """
+    Insert a sample actor and return its id.
+
+    Uses a Core insert with RETURNING instead of the ORM
+    unit-of-work: no instance instrumentation or identity-map entry,
+    and the row stays inside the rollback-isolated test transaction.
+    """
+    from sqlalchemy import insert
+
+    from models import db, Actor
+
+    result = db.session.execute(
+        insert(Actor)
+        .values(**{**NEW_ACTOR, **(overrides or {})})
+        .returning(Actor.id)
+    )
+    return result.scalar_one()
+
+
+def seed_movie(overrides=None):
+    """Insert a sample movie and return its id (see seed_actor)"""
+    from sqlalchemy import insert
+
+    from models import db, Movie
+
+    fields = {
+        'title': NEW_MOVIE['title'],
+        'release_date': NEW_MOVIE_DATE
+    }
+    fields.update(overrides or {})
+    result = db.session.execute(
+        insert(Movie).values(**fields).returning(Movie.id)
+    )
+    return result.scalar_one()
+
+
+# ============================================================================
+# Actor Endpoint Tests - Success and RBAC Behavior
+# ============================================================================
+# Each parametrized test covers the allowed role (success behavior)
+# and the highest role that must be rejected with a 403.
+
+def test_get_actors(client):
+    """Test GET /actors with the lowest role that may view actors"""
+    seed_actor()
+
+    res = client.get(ACTORS, headers=ASSISTANT_HEADERS)
+    data = res.get_json()
+
+    assert res.status_code == 200
+    assert data['success'] is True
+    assert data['actors']
+    assert len(data['actors']) > 0
+
+
+@pytest.mark.parametrize('headers,expected', [
+    (DIRECTOR_HEADERS, 200),
+    (ASSISTANT_HEADERS, 403),
+], ids=['director', 'assistant'])
+def test_create_actor(client, headers, expected):
+    """Test POST /actors across roles"""
+    res = client.post(
+        ACTORS,
+        json=NEW_ACTOR,
+        headers=headers
+    )
+    data = res.get_json()
+
+    assert res.status_code == expected
+    assert data['success'] is (expected == 200)
+    if expected == 200:
+        assert data['actor']['name'] == NEW_ACTOR['name']
+
+
+def test_update_actor_success(client):
+    """Test PATCH /actors/<id> with valid token"""
+    actor_id = seed_actor()
+
+    updated_data = {'name': 'Tom Hanks Updated', 'age': 66}
+
+    res = client.patch(
+        actor_url(actor_id),
+        json=updated_data,
+        headers=DIRECTOR_HEADERS
+    )
+    data = res.get_json()
+
+    assert res.status_code == 200
+    assert data['success'] is True
+    assert data['actor']['name'] == updated_data['name']
+
+
+@pytest.mark.parametrize('headers,expected', [
+    (DIRECTOR_HEADERS, 200),
+    (ASSISTANT_HEADERS, 403),
+], ids=['director', 'assistant'])
+def test_delete_actor(client, headers, expected):
+    """Test DELETE /actors/<id> across roles"""
+    # A denied request is rejected by @requires_auth before the route
+    # body runs, so the 403 case needs no seeded row — any id will do
+    actor_id = seed_actor() if expected == 200 else 1
+
+    res = client.delete(
+        actor_url(actor_id),
+        headers=headers
+    )
+    data = res.get_json()
+
+    assert res.status_code == expected
+    assert data['success'] is (expected == 200)
+    if expected == 200:
+        assert data['delete'] == actor_id
+
+
+# ============================================================================
+# Movie Endpoint Tests - Success and RBAC Behavior
+# ============================================================================
+
+def test_get_movies(client):
+    """Test GET /movies with the lowest role that may view movies"""
+    seed_movie()
+
+    res = client.get(MOVIES, headers=ASSISTANT_HEADERS)
+    data = res.get_json()
+
+    assert res.status_code == 200
+    assert data['success'] is True
+    assert data['movies']
+    assert len(data['movies']) > 0
+
+
+@pytest.mark.parametrize('headers,expected', [
+    (PRODUCER_HEADERS, 200),
+    (DIRECTOR_HEADERS, 403),
+], ids=['producer', 'director'])
+def test_create_movie(client, headers, expected):
+    """Test POST /movies across roles"""
+    res = client.post(
+        MOVIES,
+        json=NEW_MOVIE,
+        headers=headers
+    )
+    data = res.get_json()
+
+    assert res.status_code == expected
+    assert data['success'] is (expected == 200)
+    if expected == 200:
+        assert data['movie']['title'] == NEW_MOVIE['title']
+
+
+def test_update_movie_success(client):
+    """Test PATCH /movies/<id> with valid token"""
+    movie_id = seed_movie()
+
+    updated_data = {'title': 'Forrest Gump Updated'}
+
+    res = client.patch(
+        movie_url(movie_id),
+        json=updated_data,
+        headers=DIRECTOR_HEADERS
+    )
+    data = res.get_json()
+
+    assert res.status_code == 200
+    assert data['success'] is True
+    assert data['movie']['title'] == updated_data['title']
+
+
+@pytest.mark.parametrize('headers,expected', [
+    (PRODUCER_HEADERS, 200),
+    (DIRECTOR_HEADERS, 403),
+], ids=['producer', 'director'])
+def test_delete_movie(client, headers, expected):
+    """Test DELETE /movies/<id> across roles"""
+    # See test_delete_actor: no seed needed when auth rejects first
+    movie_id = seed_movie() if expected == 200 else 1
+
+    res = client.delete(
+        movie_url(movie_id),
+        headers=headers
+    )
+    data = res.get_json()
+
+    assert res.status_code == expected
+    assert data['success'] is (expected == 200)
+    if expected == 200:
+        assert data['delete'] == movie_id
+
+
+# ============================================================================
+# Error Behavior Tests
+# ============================================================================
+
+def test_get_actors_no_auth_header(client):
+    """Test GET /actors without authorization header"""
+    res = client.get(ACTORS)
+    data = res.get_json()
+
+    assert res.status_code == 401
+    assert data['success'] is False
+
+
+def test_create_actor_missing_data(client):
+    """Test POST /actors with missing required fields"""
+    incomplete_actor = {'name': 'John Doe'}
+
+    res = client.post(
+        ACTORS,
+        json=incomplete_actor,
+        headers=DIRECTOR_HEADERS
+    )
+    data = res.get_json()
+
+    assert res.status_code == 400
+    assert data['success'] is False
+
+
+def test_update_actor_not_found(client):
+    """Test PATCH /actors/<id> with non-existent actor"""
+    updated_data = {'name': 'Non Existent Actor'}
+
+    res = client.patch(
+        actor_url(999999),
+        json=updated_data,
+        headers=DIRECTOR_HEADERS
+    )
+    data = res.get_json()
+
+    assert res.status_code == 404
+    assert data['success'] is False
+
+
+def test_delete_actor_not_found(client):
+    """Test DELETE /actors/<id> with non-existent actor"""
+    res = client.delete(
+        actor_url(999999),
+        headers=DIRECTOR_HEADERS
+    )
+    data = res.get_json()
+
+    assert res.status_code == 404
+    assert data['success'] is False
+
+
+def test_get_movies_no_auth_header(client):
+    """Test GET /movies without authorization header"""
+    res = client.get(MOVIES)
+    data = res.get_json()
+
+    assert res.status_code == 401
+    assert data['success'] is False
+
+
+def test_create_movie_missing_data(client):
+    """Test POST /movies with missing required fields"""
+    incomplete_movie = {'title': 'Incomplete Movie'}
+
+    res = client.post(
+        MOVIES,
+        json=incomplete_movie,
+        headers=PRODUCER_HEADERS
+    )
+    data = res.get_json()
+
+    assert res.status_code == 400
+    assert data['success'] is False
+
+
+def test_update_movie_not_found(client):
+    """Test PATCH /movies/<id> with non-existent movie"""
+    updated_data = {'title': 'Non Existent Movie'}
+
+    res = client.patch(
+        movie_url(999999),
+        json=updated_data,
+        headers=DIRECTOR_HEADERS
+    )
+    data = res.get_json()
+
+    assert res.status_code == 404
+    assert data['success'] is False
+
+
+def test_delete_movie_not_found(client):
+    """Test DELETE /movies/<id> with non-existent movie"""
+    res = client.delete(
+        movie_url(999999),
+        headers=PRODUCER_HEADERS
+    )
+    data = res.get_json()
+
+    assert res.status_code == 404
+    assert data['success'] is False